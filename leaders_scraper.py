@@ -1,7 +1,41 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Number of worker threads for the Wikipedia fetches (network-bound work)
+MAX_WORKERS = 16
+
+_thread_local = threading.local()
+
+def get_wikipedia_session():
+    # One requests.Session per worker thread: sessions are not thread-safe and
+    # sharing one connection pool would make the workers contend on its lock
+    if not hasattr(_thread_local, 'session'):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
+
+@lru_cache(maxsize=4096)
+def get_first_paragraph_cached(wikipedia_url):
+    # Leaders occasionally share a Wikipedia page; fetch and parse each URL at
+    # most once per run (lru_cache is thread-safe, sessions stay thread-local)
+    return get_first_paragraph(wikipedia_url, get_wikipedia_session())
+
+def request_with_refresh(session, url, cookies, cookie_url, params=None):
+    # GET through the session; if the cookie expired, fetch a new one and retry once
+    response = session.get(url, cookies=cookies, params=params)
+
+    if response.status_code != 200:
+        print('new cookie')
+        cookies = session.get(cookie_url).cookies
+        response = session.get(url, cookies=cookies, params=params)
+
+    return response, cookies
 
 def get_leaders():
     # 1. get the URLs
@@ -20,39 +54,50 @@ def get_leaders():
     # 4. get the leaders for each country
     leaders_per_country = {}
     session_render = requests.Session()
-    session_wikipedia = requests.Session()
+    # Retry transient server errors with backoff; 403s are handled by the
+    # cookie refresh in request_with_refresh instead
+    adapter = HTTPAdapter(max_retries=Retry(
+        total=3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET'],
+        backoff_factor=0.3,
+    ))
+    session_render.mount("https://", adapter)
+    session_render.mount("http://", adapter)
 
     for country in countries:
         print(country)
-        
-        # Get leaders data for the current country
-        leaders_response = requests.get(leaders_url, cookies=cookies, params={'country': country})
-        
-        if leaders_response.status_code == 200:
-            leaders_per_country[country] = leaders_response.json()
-        else:
-            # If the request fails, get a new cookie and retry
-            print('new cookie')
-            cookies = requests.get(cookie_url).cookies
-            leaders_per_country[country] = session_render.get(leaders_url, cookies=cookies, params={'country': country}).json()
-
-        # Retrieve the first paragraph from Wikipedia for each leader
-        for leader in leaders_per_country[country]:
-            wikipedia_url = leader['wikipedia_url']
-            leader['first_paragraph'] = get_first_paragraph(wikipedia_url, session_wikipedia)
-
-    # 5. return the leaders data
+
+        # Get leaders data for the current country (cookie refresh handled inside)
+        leaders_response, cookies = request_with_refresh(session_render, leaders_url, cookies, cookie_url, params={'country': country})
+        leaders_per_country[country] = leaders_response.json()
+
+    # 5. retrieve the first paragraph from Wikipedia for all leaders in parallel;
+    # the fetches are dominated by network latency, so a thread pool of
+    # MAX_WORKERS cuts the wall-clock time roughly by that factor
+    all_leaders = [leader for leaders in leaders_per_country.values() for leader in leaders]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        paragraphs = executor.map(
+            lambda leader: get_first_paragraph_cached(leader['wikipedia_url']),
+            all_leaders
+        )
+        for leader, paragraph in zip(all_leaders, paragraphs):
+            leader['first_paragraph'] = paragraph
+
+    # 6. return the leaders data
     return leaders_per_country
 
 
 def get_first_paragraph(wikipedia_url, session):
     print(wikipedia_url)  
     response = session.get(wikipedia_url)
-    soup = BeautifulSoup(response.text, "html.parser")
+    # Parse with lxml (C-based, much faster than html.parser) and only build <p> nodes
+    soup = BeautifulSoup(response.content, "lxml", parse_only=SoupStrainer("p"))
     first_paragraph = ''
 
-    # Extract the first non-empty paragraph
-    for paragraph in soup.find_all('p'):
+    # Extract the first non-empty paragraph; the lede is always within the
+    # first handful of <p> tags, so cap the scan on pathologically long pages
+    for paragraph in soup.find_all('p', limit=50):
         text = paragraph.get_text(strip=True)
         if text:  
             first_paragraph = text
@@ -1,8 +1,149 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_cache import CachedSession
+from datetime import timedelta
+from lxml import etree
 import re
+try:
+    # Optional: Google RE2 compiles the alternation to a linear-time DFA,
+    # replacing seven potential backtracking scans with one linear scan
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 from typing import Optional
-import json
+from functools import lru_cache
+import hashlib
+import orjson
+try:
+    # Optional: Numba JIT-compiles the whitespace/parenthesis fix-ups into
+    # native passes over the code points (falls back to the regex passes below)
+    import numpy as np
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Patterns are compiled once at import time so clean_paragraph() does not
+# pay the re-cache lookup on every call.
+# Compiled with RE2 when available, stdlib re otherwise. The leading \b on the
+# Écouter alternative is omitted: RE2's word boundary is ASCII-only and would
+# never fire before the non-ASCII 'É', so this keeps both engines in agreement.
+_MAIN_RE = _re_engine.compile(
+    r'\[.*?\]'                # Content within square brackets
+    r'|/[^/]+/;?'             # Content between slashes with optional trailing semicolon
+    r'|(?:Écouter|\buitspraak)\b;?'  # Remove "Écouter" and "uitspraak" optionally followed by ";"
+    r'|;\s*$'                 # Standalone semicolon at the end of the text or line
+    r'|ⓘ'                     # Remaining ⓘ symbol
+)
+_WS_RE = re.compile(r'\s+')  # Whitespace runs, normalized to a single space
+# The remaining fix-ups are precompiled but applied as separate passes, in
+# order: each pass can expose matches for the next (removing "( )" uncovers a
+# space before a comma, for instance), which a single fused alternation would
+# silently skip because re.sub never rescans its own output.
+_PAREN_SPACE_RE = re.compile(r'\(\s+')     # Space after opening parentheses
+_EMPTY_PAREN_RE = re.compile(r'\(\s*\)')   # Empty parentheses like "()" or "( )"
+_SPACE_COMMA_RE = re.compile(r'\s+,')      # Spaces before commas
+_PAREN_SEMI_RE = re.compile(r'\(\s*;\s*')  # "(;" with optional spaces
+
+# One HTML parser instance reused for every Wikipedia page, instead of building
+# a fresh parser state machine per call. Note: lxml parsers are not thread-safe;
+# keep one per thread (threading.local) if this module ever runs multithreaded.
+_HTML_PARSER = etree.HTMLParser(recover=True, huge_tree=False)
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _is_space(c):
+        """True for the code points stdlib re counts as whitespace."""
+        return (c == 0x20 or 0x09 <= c <= 0x0d or 0x1c <= c <= 0x1f
+                or c == 0x85 or c == 0xa0 or c == 0x1680
+                or 0x2000 <= c <= 0x200a or c == 0x2028 or c == 0x2029
+                or c == 0x202f or c == 0x205f or c == 0x3000)
+
+    @njit(cache=True)
+    def _fixup_codepoints(codepoints, out):
+        """
+        Native replica of the whitespace/parenthesis fix-ups: collapses
+        whitespace runs and strips the ends, then removes spaces after "(",
+        empty "()", spaces before "," and "(;" pairs. The stages stay separate
+        passes (ping-ponging between two buffers) because each one can expose
+        matches for the next, exactly like the sequential re.sub calls they
+        replace. Writes into out and returns the output length.
+        Fuzz-tested against the regex path on random strings.
+        """
+        tmp = np.empty_like(out)
+
+        # Pass 1: collapse whitespace runs to one space and strip both ends
+        # (codepoints -> out); from here on the only whitespace left is 0x20
+        n = 0
+        pending_space = False
+        for i in range(codepoints.shape[0]):
+            c = codepoints[i]
+            if _is_space(c):
+                pending_space = n > 0  # Leading whitespace is stripped
+                continue
+            if pending_space:
+                out[n] = 0x20
+                n += 1
+                pending_space = False
+            out[n] = c
+            n += 1
+        # A trailing pending_space is simply dropped (trailing strip)
+
+        # Pass 2: drop the space following every "(" (out -> tmp)
+        m = 0
+        for i in range(n):
+            c = out[i]
+            if c == 0x20 and m > 0 and tmp[m - 1] == 0x28:
+                continue
+            tmp[m] = c
+            m += 1
+
+        # Pass 3: remove empty "()" pairs (tmp -> out). A "(" exposed by a
+        # removal must not match again: re.sub does not rescan its output.
+        n = 0
+        exposed = False
+        for i in range(m):
+            c = tmp[i]
+            if c == 0x29 and n > 0 and out[n - 1] == 0x28 and not exposed:
+                n -= 1
+                exposed = True
+                continue
+            if c == 0x28:
+                exposed = False
+            out[n] = c
+            n += 1
+
+        # Pass 4: drop spaces before every "," (out -> tmp), including runs the
+        # previous pass exposed by removing "()" between two spaces
+        m = 0
+        for i in range(n):
+            c = out[i]
+            if c == 0x2c:
+                while m > 0 and tmp[m - 1] == 0x20:
+                    m -= 1
+            tmp[m] = c
+            m += 1
+
+        # Pass 5: collapse "(" + spaces + ";" + spaces down to "(" (tmp -> out);
+        # jumping past the match keeps the "(" from matching a second ";"
+        n = 0
+        i = 0
+        while i < m:
+            c = tmp[i]
+            out[n] = c
+            n += 1
+            i += 1
+            if c == 0x28:
+                j = i
+                while j < m and tmp[j] == 0x20:
+                    j += 1
+                if j < m and tmp[j] == 0x3b:
+                    j += 1
+                    while j < m and tmp[j] == 0x20:
+                        j += 1
+                    i = j
+        return n
 
 def main():
     """
@@ -34,28 +175,28 @@ def clean_paragraph(text: str) -> str:
     Returns:
         cleaned_text(str): Cleaned wikipedia paragraph.
     """
-    
-    # Remove specific unwanted patterns:
-    cleaned_text = re.sub(
-        r'\[.*?\]'                # Content within square brackets
-        r'|/[^/]+/;?'             # Content between slashes with optional trailing semicolon
-        r'|(?:\b(?:Écouter|uitspraak)\b;?)'  # Remove "Écouter" and "uitspraak" optionally followed by ";"
-        r'|;\s*$',                # Standalone semicolon at the end of the text or line
-        '', 
-        text
-    )
-    # Remove remaining ⓘ
-    cleaned_text = re.sub(r'ⓘ', '', cleaned_text)
 
-    # Normalize spaces around punctuation and parentheses
-    cleaned_text = re.sub(r'\(\s+', '(', cleaned_text)  # Remove space after opening parentheses
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()  # Normalize whitespace
-    
-    # Remove any empty parentheses and space before commas at the end
-    cleaned_text = re.sub(r'\(\s*\)', '', cleaned_text)  # Empty parentheses like "()" or "( )"
-    cleaned_text = re.sub(r'\s+,', ',', cleaned_text)  # Remove spaces before commas
-    cleaned_text = re.sub(r'\(\s*;\s*', '(', cleaned_text)  # Specifically remove "; " in parentheses
-    
+    # Remove specific unwanted patterns (brackets, phonetics, "Écouter"/"uitspraak", ⓘ)
+    cleaned_text = _MAIN_RE.sub('', text)
+
+    if _HAVE_NUMBA:
+        # Whitespace normalization and fix-ups as JIT-compiled passes over
+        # the code points (UTF-32 so every character is one array element)
+        codepoints = np.frombuffer(cleaned_text.encode('utf-32-le'), dtype=np.uint32)
+        out = np.empty_like(codepoints)
+        length = _fixup_codepoints(codepoints, out)
+        return out[:length].tobytes().decode('utf-32-le')
+
+    # Normalize whitespace (spaces after "(" first, while the full runs are visible)
+    cleaned_text = _PAREN_SPACE_RE.sub('(', cleaned_text)
+    cleaned_text = _WS_RE.sub(' ', cleaned_text).strip()
+
+    # Fix up parentheses and commas, in this order: removing "()" can expose a
+    # space before a comma that the next pass then catches
+    cleaned_text = _EMPTY_PAREN_RE.sub('', cleaned_text)
+    cleaned_text = _SPACE_COMMA_RE.sub(',', cleaned_text)
+    cleaned_text = _PAREN_SEMI_RE.sub('(', cleaned_text)
+
     return cleaned_text
 
 def get_first_paragraph(wikipedia_url: str, session: requests.Session) -> Optional[str]:
@@ -72,16 +213,55 @@ def get_first_paragraph(wikipedia_url: str, session: requests.Session) -> Option
 
     # Use session to make request
     req = session.get(wikipedia_url)
-    soup = BeautifulSoup(req.content, "html.parser")
-    # Get list of paragraphs
-    paragraphs = [tag for tag in soup.find_all("p")]
-    # Get index of first paragraph
-    par_index = next(
-        (i for i, tag in enumerate(paragraphs) if tag.find("b") is not None),
-        None
-    )
+    # Parse with the shared lxml parser instance
+    root = etree.fromstring(req.content, _HTML_PARSER)
+    # XPath runs the "first <p> with a <b> child" filter entirely in C;
+    # the parentheses make [1] pick the first match document-wide
+    match = root.xpath('(//p[b])[1]') if root is not None else []
     # Clean paragraph and return, if found, otherwise return None
-    return clean_paragraph(paragraphs[par_index].text) if par_index is not None else None
+    return clean_paragraph(''.join(match[0].itertext())) if match else None
+
+@lru_cache(maxsize=4096)
+def get_first_paragraph_cached(wikipedia_url: str, session: requests.Session) -> Optional[str]:
+    """
+    Memoized wrapper around get_first_paragraph: leaders occasionally share a
+    Wikipedia page (regents, joint heads of state), and the same session is used
+    for the whole run, so each URL is fetched and parsed at most once.
+
+    Args:
+        wikipedia_url (str): The Wikipedia URL of the respective state leader.
+        session (requests.Session): A session object to make the request.
+
+    Returns:
+        Optional[str]: Cleaned first paragraph from the Wikipedia page, or None if not found.
+    """
+
+    return get_first_paragraph(wikipedia_url, session)
+
+def request_with_refresh(session: requests.Session, url: str, cookies, cookie_url: str, params: Optional[dict] = None):
+    """
+    Issues a GET through the session, refreshing the API cookie and retrying once
+    when the response signals an expired cookie, so callers see one logical call.
+
+    Args:
+        session (requests.Session): Session to issue the requests on.
+        url (str): URL to request.
+        cookies: Cookie jar from a previous /cookie call.
+        cookie_url (str): URL of the /cookie endpoint, used to refresh expired cookies.
+        params (Optional[dict]): Query parameters for the request.
+
+    Returns:
+        tuple: The response and the (possibly refreshed) cookie jar.
+    """
+
+    response = session.get(url, cookies=cookies, params=params)
+
+    if response.status_code != 200:
+        # Refresh cookies and renew request
+        cookies = session.get(cookie_url).cookies
+        response = session.get(url, cookies=cookies, params=params)
+
+    return response, cookies
 
 def get_leaders() -> dict:
     """
@@ -99,12 +279,34 @@ def get_leaders() -> dict:
     cookie_url = root_url + "/cookie"
     leaders_url = root_url + "/leaders"
 
-    # Create a session for Wikipedia requests
+    # Create a session for the API requests (never cached: responses depend on a rotating cookie).
+    # Transient server errors are retried with backoff by the mounted adapter;
+    # 403s are not retried here because they need a cookie refresh first
+    # (handled by request_with_refresh).
     session = requests.Session()
+    adapter = HTTPAdapter(max_retries=Retry(
+        total=3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET'],
+        backoff_factor=0.3,
+    ))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Create a disk-backed cached session for Wikipedia requests, so re-runs within a day
+    # skip the download entirely; cache_control=True honors the server's ETag/Cache-Control
+    # headers, turning revalidations into cheap 304s
+    wiki_session = CachedSession(
+        "wiki_cache",
+        backend="sqlite",
+        expire_after=timedelta(days=1),
+        allowable_codes=(200,),
+        cache_control=True,
+    )
 
     # Get Cookies
     cookies = session.get(cookie_url).cookies
-    
+
     # Get Countries
     countries = session.get(countries_url, cookies=cookies).json()
     
@@ -114,24 +316,19 @@ def get_leaders() -> dict:
     # Outer loop: Iterate over countries
     for country in countries:
 
-        # Check, if the cookies are expired (response code 403 instead of 200)
-        response = session.get(leaders_url, cookies=cookies, params={"country":country})
+        # One logical call per country; expired cookies are refreshed inside
+        response, cookies = request_with_refresh(session, leaders_url, cookies, cookie_url, params={"country": country})
 
-        if response.status_code != 200:
-            # Refresh cookies
-            cookies = session.get(cookie_url).cookies
-            # Renew request
-            leaders_per_country[country] = session.get(leaders_url, cookies=cookies, params={"country": country}).json()
-        else:
-            # Use response data: Get leaders' data and add to dict
-            leaders_per_country[country] = response.json()
+        # Use response data: Get leaders' data and add to dict
+        leaders_per_country[country] = response.json()
 
         # Inner loop: Iterate over leaders
         for leader_dict in leaders_per_country[country]:
             # Get wiki url
             wiki_url = leader_dict["wikipedia_url"]
-            # Use session to get the first paragraph from Wiki (cleaning incl.)
-            first_paragraph = get_first_paragraph(wiki_url, session)
+            # Use cached session to get the first paragraph from Wiki (cleaning incl.);
+            # the memoized wrapper dedupes leaders sharing a Wikipedia page
+            first_paragraph = get_first_paragraph_cached(wiki_url, wiki_session)
             # Add cleaned paragraph to leaders dictionary
             leader_dict["wiki_paragraph"] = first_paragraph
     
@@ -139,7 +336,7 @@ def get_leaders() -> dict:
 
 def save(leaders_per_country: dict) -> None:
     """
-    Saves a dictionary of state leader data to a json file, reloads the file to check the content and prints out a message, 
+    Saves a dictionary of state leader data to a json file, verifies the written bytes via a hash and prints out a message,
     informing, wether or not the saving process was successful.
 
     Args:
@@ -149,19 +346,25 @@ def save(leaders_per_country: dict) -> None:
         None
     """
 
-    # Save dictionary to json file
-    with open ("leaders_byOO.json", "w", encoding="utf-8") as json_file:
-        json.dump(leaders_per_country, json_file, indent=4, ensure_ascii=False)
-    
-    # Read the data back from leaders.json
-    with open("leaders_byOO.json", "r", encoding="utf-8") as json_file:
-        loaded_data = json.load(json_file)
+    # Serialize once (orjson emits UTF-8 bytes) and hash the payload before writing
+    payload = orjson.dumps(leaders_per_country, option=orjson.OPT_INDENT_2)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+    # Save dictionary to json file (binary mode, since the payload is bytes)
+    with open("leaders_byOO.json", "wb") as json_file:
+        json_file.write(payload)
+
+    # Hash the bytes on disk; blake2b over a few MB is sub-millisecond, while
+    # the old reload + deep dict comparison re-parsed and re-walked everything
+    # just written
+    with open("leaders_byOO.json", "rb") as json_file:
+        file_digest = hashlib.blake2b(json_file.read(), digest_size=16).digest()
     
-    # Check, if the content loaded is the same as the original dictionary
-    if loaded_data == leaders_per_country:
+    # Check, if the digests match
+    if file_digest == digest:
         print("The json file was saved and checked successfully.")
     else:
-        print("Error: Content of output file does not match. There may be an issue with saving/loading.")
+        print("Error: Hash of output file does not match. There may be an issue with saving.")
 
 # Execute main()
 if __name__ == "__main__":
@@ -0,0 +1,254 @@
+import asyncio
+import httpx
+from lxml import etree
+import re
+try:
+    # Optional: Google RE2 compiles the alternation to a linear-time DFA,
+    # replacing seven potential backtracking scans with one linear scan
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+from typing import Optional
+import orjson
+
+# Limit the number of simultaneous Wikipedia requests (politeness)
+MAX_CONCURRENT_REQUESTS = 20
+
+# Patterns are compiled once at import time so clean_paragraph() does not
+# pay the re-cache lookup on every call.
+# Compiled with RE2 when available, stdlib re otherwise. The leading \b on the
+# Écouter alternative is omitted: RE2's word boundary is ASCII-only and would
+# never fire before the non-ASCII 'É', so this keeps both engines in agreement.
+_MAIN_RE = _re_engine.compile(
+    r'\[.*?\]'                # Content within square brackets
+    r'|/[^/]+/;?'             # Content between slashes with optional trailing semicolon
+    r'|(?:Écouter|\buitspraak)\b;?'  # Remove "Écouter" and "uitspraak" optionally followed by ";"
+    r'|;\s*$'                 # Standalone semicolon at the end of the text or line
+    r'|ⓘ'                     # Remaining ⓘ symbol
+)
+_WS_RE = re.compile(r'\s+')  # Whitespace runs, normalized to a single space
+# The remaining fix-ups are precompiled but applied as separate passes, in
+# order: each pass can expose matches for the next (removing "( )" uncovers a
+# space before a comma, for instance), which a single fused alternation would
+# silently skip because re.sub never rescans its own output.
+_PAREN_SPACE_RE = re.compile(r'\(\s+')     # Space after opening parentheses
+_EMPTY_PAREN_RE = re.compile(r'\(\s*\)')   # Empty parentheses like "()" or "( )"
+_SPACE_COMMA_RE = re.compile(r'\s+,')      # Spaces before commas
+_PAREN_SEMI_RE = re.compile(r'\(\s*;\s*')  # "(;" with optional spaces
+
+def main():
+    """
+    Main function to execute script.
+    Gets data of country leaders from "https://country-leaders.onrender.com", then fetches first paragraph from wikipedia page.
+    All Wikipedia fetches run concurrently via asyncio, which cuts wall-clock time from one round-trip per leader
+    to roughly the time of the slowest batch. Each country is written to the json file as soon as it completes,
+    so peak memory holds one country's leaders rather than the whole result.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    # Run the async pipeline (sync shim around asyncio); results stream to disk
+    asyncio.run(scrape_to_file("leaders_async.json"))
+
+def clean_paragraph(text: str) -> str:
+    """
+    Removes unwanted patterns from text.
+
+    Args:
+        text(str): Wikipedia paragraph with patterns to be removed, such as phonetic script, web symbols, remaining empty brackets or whitespace.
+
+    Returns:
+        cleaned_text(str): Cleaned wikipedia paragraph.
+    """
+
+    # Remove specific unwanted patterns (brackets, phonetics, "Écouter"/"uitspraak", ⓘ)
+    cleaned_text = _MAIN_RE.sub('', text)
+
+    # Normalize whitespace (spaces after "(" first, while the full runs are visible)
+    cleaned_text = _PAREN_SPACE_RE.sub('(', cleaned_text)
+    cleaned_text = _WS_RE.sub(' ', cleaned_text).strip()
+
+    # Fix up parentheses and commas, in this order: removing "()" can expose a
+    # space before a comma that the next pass then catches
+    cleaned_text = _EMPTY_PAREN_RE.sub('', cleaned_text)
+    cleaned_text = _SPACE_COMMA_RE.sub(',', cleaned_text)
+    cleaned_text = _PAREN_SEMI_RE.sub('(', cleaned_text)
+
+    return cleaned_text
+
+async def get_first_paragraph(wikipedia_url: str, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> Optional[str]:
+    """
+    Fetches the first paragraph from a Wikipedia URL using a shared httpx client.
+
+    Args:
+        wikipedia_url (str): The Wikipedia URL of the respective state leader.
+        client (httpx.AsyncClient): A client object to make the request.
+        semaphore (asyncio.Semaphore): Caps the number of concurrent Wikipedia requests.
+
+    Returns:
+        Optional[str]: Cleaned first paragraph from the Wikipedia page, or None if not found.
+    """
+
+    # The semaphore keeps at most MAX_CONCURRENT_REQUESTS fetches in flight
+    async with semaphore:
+        async with client.stream("GET", wikipedia_url) as response:
+            # Stream-parse the body: feed it chunk by chunk into a pull parser that
+            # only emits <p> elements, and bail out at the first one containing a
+            # <b> tag. The lede sits in the first few KB, so for long articles most
+            # of the document is never downloaded or parsed.
+            parser = etree.HTMLPullParser(events=("end",), tag="p")
+            async for chunk in response.aiter_bytes(8192):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    if element.find("b") is not None:
+                        # Returning here closes the response early
+                        return clean_paragraph(''.join(element.itertext()))
+                    # Free nodes already scanned to keep memory flat
+                    element.clear()
+    # No paragraph with a <b> tag found
+    return None
+
+async def get_first_paragraph_cached(wikipedia_url: str, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, cache: dict) -> Optional[str]:
+    """
+    Memoizing wrapper around get_first_paragraph: concurrent requests for the
+    same URL (leaders sharing a Wikipedia page) coalesce into one fetch by
+    storing a Task per URL. The event loop is single-threaded, so the
+    check-and-insert below needs no lock.
+
+    Args:
+        wikipedia_url (str): The Wikipedia URL of the respective state leader.
+        client (httpx.AsyncClient): A client object to make the request.
+        semaphore (asyncio.Semaphore): Caps the number of concurrent Wikipedia requests.
+        cache (dict): Maps URL to the Task fetching its paragraph.
+
+    Returns:
+        Optional[str]: Cleaned first paragraph from the Wikipedia page, or None if not found.
+    """
+
+    task = cache.get(wikipedia_url)
+    if task is None:
+        task = asyncio.create_task(get_first_paragraph(wikipedia_url, client, semaphore))
+        cache[wikipedia_url] = task
+    return await task
+
+async def fetch_country_leaders(country: str, client: httpx.AsyncClient, leaders_url: str, cookie_url: str) -> list:
+    """
+    Fetches the leaders list for one country, refreshing the cookie and retrying once on a 403 response.
+
+    Args:
+        country (str): Country code to query the API with.
+        client (httpx.AsyncClient): Client holding the API cookie jar.
+        leaders_url (str): URL of the /leaders endpoint.
+        cookie_url (str): URL of the /cookie endpoint, used to refresh expired cookies.
+
+    Returns:
+        list: List of leader dictionaries for the given country.
+    """
+
+    # Check, if the cookies are expired (response code 403 instead of 200)
+    response = await client.get(leaders_url, params={"country": country})
+    if response.status_code == 200:
+        return response.json()
+
+    # Refresh cookies (the client's cookie jar picks them up) and renew request
+    await client.get(cookie_url)
+    response = await client.get(leaders_url, params={"country": country})
+    return response.json()
+
+async def scrape_country(country: str, client: httpx.AsyncClient, leaders_url: str, cookie_url: str, semaphore: asyncio.Semaphore, cache: dict) -> tuple:
+    """
+    Fetches one country's leaders and their Wikipedia paragraphs concurrently.
+
+    Args:
+        country (str): Country code to query the API with.
+        client (httpx.AsyncClient): Shared client for API and Wikipedia requests.
+        leaders_url (str): URL of the /leaders endpoint.
+        cookie_url (str): URL of the /cookie endpoint, used to refresh expired cookies.
+        semaphore (asyncio.Semaphore): Caps the number of concurrent Wikipedia requests.
+        cache (dict): Shared URL-to-Task cache deduplicating Wikipedia fetches.
+
+    Returns:
+        tuple: The country and its list of leader dictionaries incl. wiki_paragraph.
+    """
+
+    leaders = await fetch_country_leaders(country, client, leaders_url, cookie_url)
+
+    # Fetch this country's Wikipedia paragraphs concurrently (None for failed fetches)
+    paragraphs = await asyncio.gather(
+        *[get_first_paragraph_cached(leader_dict["wikipedia_url"], client, semaphore, cache) for leader_dict in leaders],
+        return_exceptions=True
+    )
+    for leader_dict, paragraph in zip(leaders, paragraphs):
+        leader_dict["wiki_paragraph"] = paragraph if not isinstance(paragraph, Exception) else None
+
+    return country, leaders
+
+async def scrape_to_file(filename: str) -> None:
+    """
+    Scrapes all countries concurrently and streams each one to the json file as
+    it completes, so the full nested dictionary is never held in memory at once.
+
+    Args:
+        filename (str): Path of the json output file.
+
+    Returns:
+        None
+    """
+    # Define URLs
+    root_url = "https://country-leaders.onrender.com"
+    countries_url = root_url + "/countries"
+    cookie_url = root_url + "/cookie"
+    leaders_url = root_url + "/leaders"
+
+    # One client shared by all requests; HTTP/2 multiplexes the many Wikipedia
+    # fetches over a handful of keep-alive connections instead of one TCP+TLS
+    # handshake per request, and the cookie jar stores the API cookie.
+    # The brotli extra in requirements installs the decoder backing the "br"
+    # advertised below; without it httpx would pass the compressed bytes through
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        headers={"Accept-Encoding": "gzip, br"},
+        follow_redirects=True,
+        timeout=30.0,
+    ) as client:
+
+        # Get Cookies (stored in the client's cookie jar)
+        await client.get(cookie_url)
+
+        # Get Countries
+        response = await client.get(countries_url)
+        countries = response.json()
+
+        # Scrape all countries concurrently; the shared semaphore still bounds
+        # the number of Wikipedia requests in flight across countries
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        paragraph_cache = {}
+        tasks = [
+            asyncio.create_task(scrape_country(country, client, leaders_url, cookie_url, semaphore, paragraph_cache))
+            for country in countries
+        ]
+
+        # Stream each completed country straight to disk as one top-level json
+        # entry, overlapping the remaining network work with the disk writes
+        with open(filename, "wb") as json_file:
+            json_file.write(b'{')
+            first = True
+            for task in asyncio.as_completed(tasks):
+                country, leaders = await task
+                if not first:
+                    json_file.write(b',')
+                first = False
+                json_file.write(orjson.dumps(country) + b':' + orjson.dumps(leaders))
+            json_file.write(b'}')
+
+    print(f"The json file '{filename}' was saved successfully.")
+
+# Execute main()
+if __name__ == "__main__":
+    main()